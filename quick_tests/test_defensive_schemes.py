@@ -13,12 +13,23 @@ from football.enhanced_resolution import (
 )
 
 from football.play_analyzer import PlayAnalysis, PlayMatchupFactor
+from football.play_resolution import PlayOutcome
 from football.plays import FootballPlay
-from types import SimpleNamespace
+from typing import NamedTuple
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
 
+class BaseResult(NamedTuple):
+    """The base play result the enhanced engine builds on."""
+
+    outcome: PlayOutcome
+    yards_gained: int
+    dice_roll: int
+    total_modifier: int
+    final_total: int
+
+
 def create_offensive_plays():
     """Create offensive plays with player assignments."""
     return {
@@ -258,10 +269,9 @@ def create_realistic_players():
     }
 
 
-def analyze_matchup_with_scheme(off_play, def_scheme, players, situation):
-    """Analyze how offensive play works against specific defensive scheme."""
+def _scheme_matchup_factors(off_play, def_scheme):
+    """Work out the advantages/disadvantages of an offense vs a scheme."""
 
-    # Create tactical analysis based on scheme matchup
     advantages = []
     disadvantages = []
 
@@ -327,6 +337,65 @@ def analyze_matchup_with_scheme(off_play, def_scheme, players, situation):
                     PlayMatchupFactor("PREVENT_RUN", +3, "Prevent can't stop runs")
                 )
 
+    return tuple(advantages), tuple(disadvantages)
+
+
+def _add_scheme_flags(schemes):
+    """Precompute the scheme flags the simulation checks for every matchup."""
+    for name, scheme in schemes.items():
+        scheme["is_blitz"] = "blitz" in name
+        scheme["pass_situation"] = {"pass_rush_pressure": scheme["is_blitz"]}
+    return schemes
+
+
+# Plays, schemes and players never change between runs, so build them once
+OFFENSIVE_PLAYS = create_offensive_plays()
+DEFENSIVE_SCHEMES = _add_scheme_flags(create_defensive_schemes())
+PLAYERS = create_realistic_players()
+
+# Each scheme's description block never changes, so render it once
+_SCHEME_HEADERS = {
+    name: (
+        f"\n🛡️  **{scheme['play'].label}**",
+        f"   📋 Coverage: {scheme['coverage']}",
+        f"   🔥 Pressure: {scheme['pressure']}",
+        f"   💪 Strength: {scheme['strength']}",
+        f"   ⚠️  Weakness: {scheme['weakness']}",
+    )
+    for name, scheme in DEFENSIVE_SCHEMES.items()
+}
+
+# Run plays are simplified to the average CB making the stop, with no
+# blockers modelled
+_RUN_DEFENDERS = (PLAYERS["avg_cb"],)
+_NO_BLOCKERS = ()
+
+# Every play/scheme pairing is fixed, so the factors are worked out once
+# at import rather than on each analysis
+_MATCHUP_TABLE = {
+    (off_play["play"].name, def_scheme["play"].name): _scheme_matchup_factors(
+        off_play, def_scheme
+    )
+    for off_play in OFFENSIVE_PLAYS.values()
+    for def_scheme in DEFENSIVE_SCHEMES.values()
+}
+
+
+def _average(total, count):
+    """Average total over count, or 0.0 when count is zero."""
+    return total / count if count else 0.0
+
+
+def analyze_matchup_with_scheme(off_play, def_scheme, players, situation):
+    """Analyze how offensive play works against specific defensive scheme."""
+
+    # Create tactical analysis based on scheme matchup
+    key = (off_play["play"].name, def_scheme["play"].name)
+    factors = _MATCHUP_TABLE.get(key)
+    if factors is None:
+        factors = _scheme_matchup_factors(off_play, def_scheme)
+    advantages, disadvantages = list(factors[0]), list(factors[1])
+
     # Calculate net impact
     net_impact = sum(adv.impact for adv in advantages) + sum(
         dis.impact for dis in disadvantages
@@ -353,9 +422,9 @@ def run_complete_analysis():
 
     engine = EnhancedResolutionEngine(seed=42)
 
-    offensive_plays = create_offensive_plays()
-    defensive_schemes = create_defensive_schemes()
-    players = create_realistic_players()
+    offensive_plays = OFFENSIVE_PLAYS
+    defensive_schemes = DEFENSIVE_SCHEMES
+    players = PLAYERS
 
     print("🏈 COMPLETE DEFENSIVE SCHEME + PLAYER ANALYSIS")
     print("=" * 80)
@@ -385,47 +454,49 @@ def run_complete_analysis():
     for scenario in test_scenarios:
         off_play = offensive_plays[scenario["offense"]]
 
-        print(
+        # Collect the scenario's report and write it out in one go
+        lines = []
+
+        # The players and play type are the same for every defense faced
+        combo = [players[key] for key in scenario["player_combo"]]
+        is_pass = off_play["play"].play_type == "pass"
+        cb = players["avg_cb"]  # Use average CB
+
+        lines.append(
             f"\n🎯 **{off_play['play'].label}** - {scenario['player_combo'][0].upper()}"
         )
-        if len(scenario["player_combo"]) > 1:
-            print(
-                f"   👥 {players[scenario['player_combo'][0]].name} ➜ {players[scenario['player_combo'][1]].name}"
-            )
+        if len(combo) > 1:
+            lines.append(f"   👥 {combo[0].name} ➜ {combo[1].name}")
         else:
-            print(f"   👤 {players[scenario['player_combo'][0]].name}")
+            lines.append(f"   👤 {combo[0].name}")
 
-        print("=" * 60)
+        lines.append("=" * 60)
 
         for def_name in scenario["defenses"]:
             def_scheme = defensive_schemes[def_name]
 
-            print(f"\n🛡️  **{def_scheme['play'].label}**")
-            print(f"   📋 Coverage: {def_scheme['coverage']}")
-            print(f"   🔥 Pressure: {def_scheme['pressure']}")
-            print(f"   💪 Strength: {def_scheme['strength']}")
-            print(f"   ⚠️  Weakness: {def_scheme['weakness']}")
+            lines.extend(_SCHEME_HEADERS[def_name])
 
             # Analyze the matchup
             analysis = analyze_matchup_with_scheme(
                 off_play, def_scheme, players, scenario["situation"]
             )
 
-            print(f"   ⚡ Net Advantage: {analysis.net_impact:+d}")
+            lines.append(f"   ⚡ Net Advantage: {analysis.net_impact:+d}")
 
             if analysis.advantages:
-                print("   ✅ Offensive Advantages:")
+                lines.append("   ✅ Offensive Advantages:")
                 for adv in analysis.advantages:
-                    print(f"      • {adv.description}")
+                    lines.append(f"      • {adv.description}")
 
             if analysis.disadvantages:
-                print("   ❌ Defensive Advantages:")
+                lines.append("   ❌ Defensive Advantages:")
                 for dis in analysis.disadvantages:
-                    print(f"      • {dis.description}")
+                    lines.append(f"      • {dis.description}")
 
             # Simulate the play result
-            base_result = SimpleNamespace(
-                outcome=SimpleNamespace(name="SUCCESS"),
+            base_result = BaseResult(
+                outcome=PlayOutcome.SUCCESS,
                 yards_gained=max(
                     1, off_play.get("route_depth", 4) + analysis.net_impact
                 ),
@@ -440,49 +511,49 @@ def run_complete_analysis():
             total_yac = 0
             trials = 15
 
-            for _ in range(trials):
-                if off_play["play"].play_type == "pass":
-                    qb = players[scenario["player_combo"][0]]
-                    wr = players[scenario["player_combo"][1]]
-                    cb = players["avg_cb"]  # Use average CB
-
-                    pressure = "blitz" in def_name
-                    sit = {"pass_rush_pressure": pressure}
-
-                    result = engine.resolve_pass_play(qb, wr, cb, base_result, sit)
+            if is_pass:
+                qb, wr = combo
 
+                for result in engine.resolve_pass_play_batch(
+                    qb, wr, cb, base_result, def_scheme["pass_situation"], trials
+                ):
                     if result.completed:
                         completions += 1
                         total_yards += result.yards_gained
                         total_yac += result.yards_after_contact
-                else:
-                    rb = players[scenario["player_combo"][0]]
-                    defenders = [players["avg_cb"]]  # Simplified
+            else:
+                rb = combo[0]
 
-                    result = engine.resolve_run_play(rb, [], defenders, base_result, {})
+                for result in engine.resolve_run_play_batch(
+                    rb, _NO_BLOCKERS, _RUN_DEFENDERS, base_result, {}, trials
+                ):
                     completions += 1
                     total_yards += result.yards_gained
                     total_yac += result.yards_after_contact
 
-            if off_play["play"].play_type == "pass":
+            if is_pass:
                 completion_rate = (completions / trials) * 100
-                avg_yards = total_yards / max(1, completions) if completions > 0 else 0
-                avg_yac = total_yac / max(1, completions) if completions > 0 else 0
-                print(
+                avg_yards = _average(total_yards, completions)
+                avg_yac = _average(total_yac, completions)
+                lines.append(
                     f"   📊 Result: {completion_rate:.0f}% completion | {avg_yards:.1f} avg yds | {avg_yac:.1f} YAC"
                 )
             else:
                 avg_yards = total_yards / trials
                 avg_yac = total_yac / trials
-                print(f"   📊 Result: {avg_yards:.1f} avg yds | {avg_yac:.1f} YAC")
+                lines.append(
+                    f"   📊 Result: {avg_yards:.1f} avg yds | {avg_yac:.1f} YAC"
+                )
 
             # Strategic assessment
             if analysis.net_impact >= 2:
-                print("   🎯 Assessment: **Strong offensive advantage**")
+                lines.append("   🎯 Assessment: **Strong offensive advantage**")
             elif analysis.net_impact <= -2:
-                print("   🛡️  Assessment: **Strong defensive advantage**")
+                lines.append("   🛡️  Assessment: **Strong defensive advantage**")
             else:
-                print("   ⚖️  Assessment: **Balanced matchup**")
+                lines.append("   ⚖️  Assessment: **Balanced matchup**")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
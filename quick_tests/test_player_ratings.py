@@ -14,7 +14,18 @@ from football.enhanced_resolution import (
     PlayerProfile,
     SkillCategory,
 )
-from types import SimpleNamespace
+from football.play_resolution import PlayOutcome
+from typing import NamedTuple
+
+
+class BaseResult(NamedTuple):
+    """The base play result the enhanced engine builds on."""
+
+    outcome: PlayOutcome
+    yards_gained: int
+    dice_roll: int
+    total_modifier: int
+    final_total: int
 
 
 def create_player_archetypes():
@@ -154,8 +165,8 @@ def create_test_scenarios():
     return [
         {
             "name": "Quick Slant (5 yards)",
-            "base_result": SimpleNamespace(
-                outcome=SimpleNamespace(name="SUCCESS"),
+            "base_result": BaseResult(
+                outcome=PlayOutcome.SUCCESS,
                 yards_gained=5,
                 dice_roll=10,
                 total_modifier=2,
@@ -165,8 +176,8 @@ def create_test_scenarios():
         },
         {
             "name": "Deep Post (18 yards)",
-            "base_result": SimpleNamespace(
-                outcome=SimpleNamespace(name="BIG_SUCCESS"),
+            "base_result": BaseResult(
+                outcome=PlayOutcome.BIG_SUCCESS,
                 yards_gained=18,
                 dice_roll=14,
                 total_modifier=3,
@@ -176,8 +187,8 @@ def create_test_scenarios():
         },
         {
             "name": "Under Pressure (8 yards)",
-            "base_result": SimpleNamespace(
-                outcome=SimpleNamespace(name="SUCCESS"),
+            "base_result": BaseResult(
+                outcome=PlayOutcome.SUCCESS,
                 yards_gained=8,
                 dice_roll=11,
                 total_modifier=1,
@@ -187,8 +198,8 @@ def create_test_scenarios():
         },
         {
             "name": "Power Run (4 yards)",
-            "base_result": SimpleNamespace(
-                outcome=SimpleNamespace(name="SUCCESS"),
+            "base_result": BaseResult(
+                outcome=PlayOutcome.SUCCESS,
                 yards_gained=4,
                 dice_roll=9,
                 total_modifier=2,
@@ -198,8 +209,8 @@ def create_test_scenarios():
         },
         {
             "name": "Outside Run (7 yards)",
-            "base_result": SimpleNamespace(
-                outcome=SimpleNamespace(name="SUCCESS"),
+            "base_result": BaseResult(
+                outcome=PlayOutcome.SUCCESS,
                 yards_gained=7,
                 dice_roll=12,
                 total_modifier=1,
@@ -210,12 +221,55 @@ def create_test_scenarios():
     ]
 
 
+# Shared empty blocker group for run plays that don't model blocking
+_NO_BLOCKERS = ()
+
+
+def _average(total, count):
+    """Average total over count, or 0.0 when count is zero."""
+    return total / count if count else 0.0
+
+
+def _simulate_pass_combo(engine, qb, wr, cb, base_result, situation, trials):
+    """Run trials of one pass matchup and total up the completed passes."""
+    totals = {"trials": trials, "completions": 0, "yards": 0, "yac": 0, "missed": 0}
+    for result in engine.resolve_pass_play_batch(
+        qb, wr, cb, base_result, situation, trials
+    ):
+        if result.completed:
+            totals["completions"] += 1
+            totals["yards"] += result.yards_gained
+            totals["yac"] += result.yards_after_contact
+            totals["missed"] += result.missed_tackles
+    return totals
+
+
+def _simulate_run_combo(engine, rb, defenders, base_result, situation, trials):
+    """Run trials of one run matchup and total up the runs without a fumble."""
+    totals = {"trials": trials, "fumbles": 0, "yards": 0, "yac": 0, "missed": 0}
+    for result in engine.resolve_run_play_batch(
+        rb, _NO_BLOCKERS, defenders, base_result, situation, trials
+    ):
+        if result.outcome == "FUMBLE":
+            totals["fumbles"] += 1
+        else:
+            totals["yards"] += result.yards_gained
+            totals["yac"] += result.yards_after_contact
+            totals["missed"] += result.missed_tackles
+    return totals
+
+
+# Archetypes and scenarios never change between runs, so build them once
+PLAYERS = create_player_archetypes()
+SCENARIOS = create_test_scenarios()
+
+
 def test_player_impact():
     """Test how different player ratings impact results."""
 
     engine = EnhancedResolutionEngine(seed=42)  # Fixed seed for consistency
-    players = create_player_archetypes()
-    scenarios = create_test_scenarios()
+    players = PLAYERS
+    scenarios = SCENARIOS
 
     print("🏈 PLAYER RATINGS IMPACT ANALYSIS")
     print("=" * 70)
@@ -229,37 +283,27 @@ def test_player_impact():
         ("elite_qb", "avg_wr", "poor_cb", "🎯 Elite QB vs Weak CB"),
     ]
 
+    # Resolve player keys once rather than per scenario
+    pass_matchups = [
+        (players[qb_key], players[wr_key], players[cb_key], description)
+        for qb_key, wr_key, cb_key, description in pass_combos
+    ]
+
     for scenario in scenarios[:3]:  # Pass scenarios
         print(f"\n🎯 **{scenario['name']}**")
         print("-" * 50)
 
-        for qb_key, wr_key, cb_key, description in pass_combos:
-            qb = players[qb_key]
-            wr = players[wr_key]
-            cb = players[cb_key]
-
+        for qb, wr, cb, description in pass_matchups:
             # Run multiple simulations
-            completions = 0
-            total_yards = 0
-            total_yac = 0
-            total_missed_tackles = 0
-            trials = 20
-
-            for _ in range(trials):
-                result = engine.resolve_pass_play(
-                    qb, wr, cb, scenario["base_result"], scenario["situation"]
-                )
-
-                if result.completed:
-                    completions += 1
-                    total_yards += result.yards_gained
-                    total_yac += result.yards_after_contact
-                    total_missed_tackles += result.missed_tackles
-
-            completion_rate = (completions / trials) * 100
-            avg_yards = total_yards / max(1, completions)
-            avg_yac = total_yac / max(1, completions)
-            avg_missed = total_missed_tackles / max(1, completions)
+            totals = _simulate_pass_combo(
+                engine, qb, wr, cb, scenario["base_result"], scenario["situation"], 20
+            )
+            completions = totals["completions"]
+
+            completion_rate = (completions / totals["trials"]) * 100
+            avg_yards = _average(totals["yards"], completions)
+            avg_yac = _average(totals["yac"], completions)
+            avg_missed = _average(totals["missed"], completions)
 
             print(f"   {description}")
             print(
@@ -278,38 +322,31 @@ def test_player_impact():
         ("speed_rb", ["elite_lb"], "🏃 Speed RB vs Elite LB"),
     ]
 
+    run_matchups = [
+        (players[rb_key], tuple(players[key] for key in def_keys), description)
+        for rb_key, def_keys, description in run_combos
+    ]
+
     for scenario in scenarios[3:]:  # Run scenarios
         print(f"\n🏃 **{scenario['name']}**")
         print("-" * 40)
 
-        for rb_key, def_keys, description in run_combos:
-            rb = players[rb_key]
-            defenders = [players[key] for key in def_keys]
-
+        for rb, defenders, description in run_matchups:
             # Run simulations
-            total_yards = 0
-            total_yac = 0
-            total_missed_tackles = 0
-            fumbles = 0
-            trials = 20
-
-            for _ in range(trials):
-                result = engine.resolve_run_play(
-                    rb, [], defenders, scenario["base_result"], scenario["situation"]
-                )
-
-                if result.outcome == "FUMBLE":
-                    fumbles += 1
-                else:
-                    total_yards += result.yards_gained
-                    total_yac += result.yards_after_contact
-                    total_missed_tackles += result.missed_tackles
-
-            successful_runs = trials - fumbles
-            avg_yards = total_yards / max(1, successful_runs)
-            avg_yac = total_yac / max(1, successful_runs)
-            avg_missed = total_missed_tackles / max(1, successful_runs)
-            fumble_rate = (fumbles / trials) * 100
+            totals = _simulate_run_combo(
+                engine,
+                rb,
+                defenders,
+                scenario["base_result"],
+                scenario["situation"],
+                20,
+            )
+
+            successful_runs = totals["trials"] - totals["fumbles"]
+            avg_yards = _average(totals["yards"], successful_runs)
+            avg_yac = _average(totals["yac"], successful_runs)
+            avg_missed = _average(totals["missed"], successful_runs)
+            fumble_rate = (totals["fumbles"] / totals["trials"]) * 100
 
             print(f"   {description}")
             print(
@@ -321,7 +358,7 @@ def test_situational_impact():
     """Test how situations affect outcomes."""
 
     engine = EnhancedResolutionEngine(seed=123)
-    players = create_player_archetypes()
+    players = PLAYERS
 
     print("\n\n🎬 **SITUATIONAL IMPACT ANALYSIS**")
     print("=" * 50)
@@ -331,8 +368,8 @@ def test_situational_impact():
     wr = players["avg_wr"]
     cb = players["avg_cb"]
 
-    base_result = SimpleNamespace(
-        outcome=SimpleNamespace(name="SUCCESS"),
+    base_result = BaseResult(
+        outcome=PlayOutcome.SUCCESS,
         yards_gained=10,
         dice_roll=11,
         total_modifier=2,
@@ -347,18 +384,10 @@ def test_situational_impact():
     print("\n📡 **Pass Play Under Different Pressure**")
 
     for situation, desc in situations:
-        completions = 0
-        total_yards = 0
-        trials = 25
-
-        for _ in range(trials):
-            result = engine.resolve_pass_play(qb, wr, cb, base_result, situation)
-            if result.completed:
-                completions += 1
-                total_yards += result.yards_gained
-
-        completion_rate = (completions / trials) * 100
-        avg_yards = total_yards / max(1, completions)
+        totals = _simulate_pass_combo(engine, qb, wr, cb, base_result, situation, 25)
+
+        completion_rate = (totals["completions"] / totals["trials"]) * 100
+        avg_yards = _average(totals["yards"], totals["completions"])
 
         print(
             f"   {desc}: {completion_rate:.0f}% completion | {avg_yards:.1f} avg yards"
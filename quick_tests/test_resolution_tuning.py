@@ -16,7 +16,26 @@ from football.play_resolution import (
 )
 from football.play_analyzer import PlayAnalysis, PlayMatchupFactor
 from football.plays import FootballPlay
-import statistics
+from functools import lru_cache
+from typing import NamedTuple
+
+
+# Fixed seed so repeated tuning runs are comparable
+TUNING_SEED = 42
+
+
+class Situation(NamedTuple):
+    """Down, distance and field position for a tuning test cell."""
+
+    down: int
+    distance: int
+    field_position: int
+
+
+SITUATIONS = (
+    Situation(down=1, distance=10, field_position=25),
+    Situation(down=3, distance=2, field_position=45),
+)
 
 
 def create_test_plays():
@@ -59,23 +78,39 @@ def create_test_analysis(play_name: str) -> PlayAnalysis:
     """Create tactical analysis similar to what our analyzer would produce."""
 
     if "trap" in play_name:
+        return _analysis_for("trap")
+    elif "power" in play_name:
+        return _analysis_for("power")
+    else:
+        return _analysis_for("base")
+
+
+@lru_cache(maxsize=None)
+def _analysis_for(kind: str) -> PlayAnalysis:
+    """Build the shared analysis for a kind of play.
+
+    The result is cached and handed to every caller, so its factor lists
+    are tuples to keep them from being changed.
+    """
+
+    if kind == "trap":
         # Trap play advantages
         return PlayAnalysis(
-            advantages=[
+            advantages=(
                 PlayMatchupFactor("TRAP_BLOCK", +1, "Trap blocking scheme creates gap"),
                 PlayMatchupFactor("TRAP_CONCEPT", +1, "Misdirection confuses defense"),
                 PlayMatchupFactor("PULLING_GUARD", +1, "Guard pulls to create angle"),
-            ],
-            disadvantages=[],
+            ),
+            disadvantages=(),
             net_impact=3,  # Capped at +3 by our tuning
-            key_matchups=["LG vs DT", "RG vs DT"],
+            key_matchups=("LG vs DT", "RG vs DT"),
             scheme_analysis={"blocking_scheme": "trap", "concept": "misdirection"},
             confidence=0.85,
         )
-    elif "power" in play_name:
+    elif kind == "power":
         # Power play advantages
         return PlayAnalysis(
-            advantages=[
+            advantages=(
                 PlayMatchupFactor(
                     "POWER_CONCEPT", +1, "Power concept creates leverage"
                 ),
@@ -85,25 +120,43 @@ def create_test_analysis(play_name: str) -> PlayAnalysis:
                 PlayMatchupFactor(
                     "EXTRA_BLOCKER", +1, "Additional blocker at point of attack"
                 ),
-            ],
-            disadvantages=[],
+            ),
+            disadvantages=(),
             net_impact=3,  # Capped at +3 by our tuning
-            key_matchups=["RG+RT vs DT", "FB vs LB"],
+            key_matchups=("RG+RT vs DT", "FB vs LB"),
             scheme_analysis={"blocking_scheme": "power", "concept": "gap_control"},
             confidence=0.80,
         )
     else:
         # Basic play
         return PlayAnalysis(
-            advantages=[],
-            disadvantages=[],
+            advantages=(),
+            disadvantages=(),
             net_impact=0,
-            key_matchups=[],
+            key_matchups=(),
             scheme_analysis={"blocking_scheme": "base"},
             confidence=0.50,
         )
 
 
+def _simulate_cell(engine, play, defense, situation, analysis, runs=15):
+    """Run one (play, situation) cell and return its yards and outcomes."""
+
+    # Hand the engine our analysis instead of having it run the play analyzer
+    snaps = engine.resolve_play_batch(
+        offensive_play=play,
+        defensive_play=defense,
+        situation=situation,
+        analysis=analysis,
+        runs=runs,
+    )
+
+    results = [result.yards_gained for result in snaps]
+    outcomes = [result.outcome.name for result in snaps]
+
+    return results, outcomes
+
+
 def test_resolution_configs():
     """Test both realistic and arcade configurations."""
 
@@ -114,92 +167,72 @@ def test_resolution_configs():
         ("Arcade", create_arcade_config()),
     ]
 
-    test_plays = [("Trap Right", trap_play), ("Power Right", power_play)]
+    # One seeded engine per config, shared by every play and situation
+    engines = {
+        config_name: PlayResolutionEngine(config, seed=TUNING_SEED)
+        for config_name, config in configs
+    }
 
-    situations = [
-        {"down": 1, "distance": 10, "field_position": 25},
-        {"down": 3, "distance": 2, "field_position": 45},
-    ]
+    test_plays = [("Trap Right", trap_play), ("Power Right", power_play)]
 
-    print("🏈 Resolution Engine Tuning Test")
-    print("=" * 60)
+    # Collect the report and write it out in one go
+    out = []
 
-    for config_name, config in configs:
-        print(f"\n🎮 {config_name} Configuration")
-        print("-" * 40)
+    out.append("🏈 Resolution Engine Tuning Test")
+    out.append("=" * 60)
 
-        engine = PlayResolutionEngine(config)
+    for config_name, engine in engines.items():
+        out.append(f"\n🎮 {config_name} Configuration")
+        out.append("-" * 40)
 
         for play_name, play in test_plays:
-            for situation in situations:
-                situation_desc = f"{situation['down']} & {situation['distance']}"
-                print(f"\n📋 {play_name} - {situation_desc}")
+            for situation in SITUATIONS:
+                situation_desc = f"{situation.down} & {situation.distance}"
+                out.append(f"\n📋 {play_name} - {situation_desc}")
 
                 # Create tactical analysis
                 analysis = create_test_analysis(play.name)
 
-                results = []
-                outcomes = []
-
-                # Run 15 simulations
-                for i in range(15):
-                    try:
-                        # Create tactical analysis for this play
-                        analysis = create_test_analysis(play.name)
-
-                        # Simulate the analyzer being called in the engine
-                        # We'll inject our analysis via monkey patching for this test
-                        original_analyze = engine.play_analyzer.analyze_play_matchup
-                        engine.play_analyzer.analyze_play_matchup = (
-                            lambda offensive_play, defensive_play: analysis
-                        )
-
-                        result = engine.resolve_play(
-                            offensive_play=play,
-                            defensive_play=defense,
-                            situation=situation,
-                        )
-
-                        # Restore original method
-                        engine.play_analyzer.analyze_play_matchup = original_analyze
-
-                        results.append(result.yards_gained)
-                        outcomes.append(result.outcome.name)
-
-                    except Exception as e:
-                        print(f"   ❌ Error: {e}")
-                        continue
+                try:
+                    results, outcomes = _simulate_cell(
+                        engine, play, defense, situation._asdict(), analysis
+                    )
+                except Exception as e:
+                    out.append(f"   ❌ Error: {e}")
+                    continue
 
                 if results:
-                    avg_yards = statistics.mean(results)
+                    avg_yards = sum(results) / len(results)
                     max_yards = max(results)
                     min_yards = min(results)
 
-                    print(
+                    out.append(
                         f"   📊 Avg: {avg_yards:.1f} yds | Range: {min_yards} to {max_yards} yds"
                     )
 
                     # Count explosive plays (>15 yards)
-                    explosive_count = sum(1 for y in results if y > 15)
+                    explosive_count = sum(y > 15 for y in results)
                     explosive_pct = (explosive_count / len(results)) * 100
 
-                    print(
+                    out.append(
                         f"   💥 Explosive plays (>15 yds): {explosive_count}/{len(results)} ({explosive_pct:.0f}%)"
                     )
 
                     # Realism assessment
                     if config_name == "Realistic":
                         if avg_yards > 8:
-                            print("   ⚠️  Still too high for realistic football")
+                            out.append("   ⚠️  Still too high for realistic football")
                         elif avg_yards > 5:
-                            print("   ✅ Good realistic average")
+                            out.append("   ✅ Good realistic average")
                         else:
-                            print("   ✅ Conservative realistic average")
+                            out.append("   ✅ Conservative realistic average")
 
                         if max_yards > 25:
-                            print("   ⚠️  Max still too explosive")
+                            out.append("   ⚠️  Max still too explosive")
                         else:
-                            print("   ✅ Reasonable max yards")
+                            out.append("   ✅ Reasonable max yards")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
@@ -5,7 +5,7 @@ Adds player ratings, yards after catch, missed tackles, and incompletions.
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Optional, List, Any
+from typing import Dict, Optional, List, Any, Tuple
 import random
 
 
@@ -119,6 +119,91 @@ class PlayExecutionResult:
         return desc
 
 
+# Pass trial outcome codes returned by _pass_trials
+_COMPLETE = 0
+_INCOMPLETE = 1
+_INTERCEPTION = 2  # Incomplete pass picked off
+_TIPPED_INTERCEPTION = 3  # Completed pass tipped to a defender
+
+
+def _roll_missed_tackles(rand, yards_after: int, modifier: int) -> int:
+    """Roll for missed tackles on a catch-and-run of yards_after yards."""
+    if yards_after <= 1:
+        return 0
+
+    # More YAC generally means more missed tackles (up to 40% chance)
+    missed_chance = min(yards_after * 10, 40) + modifier
+
+    missed_tackles = 0
+    for _ in range(min(3, yards_after // 2)):  # Max 3 missed tackles
+        if int(rand() * 100) + 1 <= missed_chance:
+            missed_tackles += 1
+            missed_chance -= 15  # Each miss makes next one less likely
+
+    return missed_tackles
+
+
+def _pass_trials(
+    rand,
+    trials: int,
+    completion_chance: int,
+    interception_risk: int,
+    completed_int_risk: int,
+    yac_high: int,
+    yac_modifier: int,
+    missed_modifier: int,
+) -> Tuple[List[int], List[int], List[int]]:
+    """Roll the dice for repeated snaps of one pass play matchup.
+
+    Works on plain ints only, so it has no per-trial attribute or dict
+    lookups, and rolls each die with a single call to rand (the engine
+    RNG's bound random method). Returns parallel lists of outcome codes,
+    yards after catch and missed tackles.
+    """
+    codes = []
+    yacs = []
+    misses = []
+    for _ in range(trials):
+        if int(rand() * 100) + 1 > completion_chance:
+            if int(rand() * 100) + 1 <= interception_risk:
+                codes.append(_INTERCEPTION)
+            else:
+                codes.append(_INCOMPLETE)
+            yacs.append(0)
+            misses.append(0)
+        elif int(rand() * 100) + 1 <= completed_int_risk:
+            codes.append(_TIPPED_INTERCEPTION)
+            yacs.append(0)
+            misses.append(0)
+        else:
+            yac = max(0, int(rand() * (yac_high + 1)) + yac_modifier)
+            codes.append(_COMPLETE)
+            yacs.append(yac)
+            misses.append(_roll_missed_tackles(rand, yac, missed_modifier))
+
+    return codes, yacs, misses
+
+
+def _run_trials(
+    rand, trials: int, miss_chances: List[int], fumble_risk: int
+) -> Tuple[List[bool], List[int]]:
+    """Roll the dice for repeated snaps of one run play matchup.
+
+    Returns parallel lists of fumble flags and missed tackles.
+    """
+    fumbles = []
+    misses = []
+    for _ in range(trials):
+        missed_tackles = 0
+        for miss_chance in miss_chances:
+            if int(rand() * 100) + 1 <= miss_chance:
+                missed_tackles += 1
+        misses.append(missed_tackles)
+        fumbles.append(int(rand() * 100) + 1 <= fumble_risk)
+
+    return fumbles, misses
+
+
 class EnhancedResolutionEngine:
     """Enhanced resolution engine with player ratings."""
 
@@ -135,6 +220,10 @@ class EnhancedResolutionEngine:
             PlayerRating.POOR: -2,
         }
 
+    def _roll_d100(self) -> int:
+        """Roll a percentile die (1-100)."""
+        return int(self.rng.random() * 100) + 1
+
     def resolve_pass_play(
         self,
         qb: PlayerProfile,
@@ -151,7 +240,7 @@ class EnhancedResolutionEngine:
         )
 
         # 2. Roll for completion
-        completion_roll = self.rng.randint(1, 100)
+        completion_roll = self._roll_d100()
         completed = completion_roll <= completion_chance
 
         if not completed:
@@ -159,7 +248,7 @@ class EnhancedResolutionEngine:
             interception_risk = self._calculate_interception_risk(
                 qb, receiver, defender, base_result, situation
             )
-            if self.rng.randint(1, 100) <= interception_risk:
+            if self._roll_d100() <= interception_risk:
                 return PlayExecutionResult(
                     outcome="INTERCEPTION",
                     yards_gained=0,
@@ -187,7 +276,7 @@ class EnhancedResolutionEngine:
         completed_int_risk = self._calculate_completed_pass_interception_risk(
             qb, receiver, defender, initial_gain, situation
         )
-        if self.rng.randint(1, 100) <= completed_int_risk:
+        if self._roll_d100() <= completed_int_risk:
             return PlayExecutionResult(
                 outcome="INTERCEPTION",
                 yards_gained=0,
@@ -246,7 +335,7 @@ class EnhancedResolutionEngine:
 
         # 4. Handle fumbles for powerful runners
         fumble_risk = self._calculate_fumble_risk(runner, defenders, total_yards)
-        if self.rng.randint(1, 100) <= fumble_risk:
+        if self._roll_d100() <= fumble_risk:
             return PlayExecutionResult(
                 outcome="FUMBLE",
                 yards_gained=0,
@@ -270,6 +359,145 @@ class EnhancedResolutionEngine:
             final_total=base_result.final_total,
         )
 
+    def resolve_pass_play_batch(
+        self,
+        qb: PlayerProfile,
+        receiver: PlayerProfile,
+        defender: PlayerProfile,
+        base_result: Any,
+        situation: Dict[str, Any],
+        trials: int,
+    ) -> List[PlayExecutionResult]:
+        """Resolve the same pass play matchup several times.
+
+        The rating-based chances only depend on the matchup, so they are
+        worked out once and only the dice are rolled per trial. Draws come
+        off the engine's RNG in the same order as repeated
+        resolve_pass_play calls.
+        """
+        completion_chance = self._calculate_completion_chance(
+            qb, receiver, defender, base_result, situation
+        )
+        interception_risk = self._calculate_interception_risk(
+            qb, receiver, defender, base_result, situation
+        )
+        initial_gain = max(0, base_result.yards_gained)
+        completed_int_risk = self._calculate_completed_pass_interception_risk(
+            qb, receiver, defender, initial_gain, situation
+        )
+
+        yac_high, yac_modifier = self._yac_profile(receiver, defender, initial_gain)
+        codes, yacs, misses = _pass_trials(
+            self.rng.random,
+            trials,
+            completion_chance,
+            interception_risk,
+            completed_int_risk,
+            yac_high,
+            yac_modifier,
+            self._missed_tackle_modifier(receiver, defender),
+        )
+
+        results = []
+        for code, yac, missed_tackles in zip(codes, yacs, misses):
+            if code == _COMPLETE:
+                results.append(
+                    PlayExecutionResult(
+                        outcome=base_result.outcome.name,
+                        yards_gained=initial_gain + yac,
+                        completed=True,
+                        initial_gain=initial_gain,
+                        yards_after_contact=yac,
+                        missed_tackles=missed_tackles,
+                        key_players=[qb.name, receiver.name],
+                        dice_roll=base_result.dice_roll,
+                        total_modifier=base_result.total_modifier,
+                        final_total=base_result.final_total,
+                    )
+                )
+                continue
+
+            if code == _INTERCEPTION:
+                outcome, key_players = "INTERCEPTION", [defender.name, qb.name]
+            elif code == _TIPPED_INTERCEPTION:
+                outcome, key_players = "INTERCEPTION", [defender.name, receiver.name]
+            else:
+                outcome, key_players = "INCOMPLETE", [defender.name]
+            results.append(
+                PlayExecutionResult(
+                    outcome=outcome,
+                    yards_gained=0,
+                    completed=False,
+                    key_players=key_players,
+                    dice_roll=base_result.dice_roll,
+                    total_modifier=base_result.total_modifier,
+                    final_total=base_result.final_total,
+                )
+            )
+
+        return results
+
+    def resolve_run_play_batch(
+        self,
+        runner: PlayerProfile,
+        blockers: List[PlayerProfile],
+        defenders: List[PlayerProfile],
+        base_result: Any,
+        situation: Dict[str, Any],
+        trials: int,
+    ) -> List[PlayExecutionResult]:
+        """Resolve the same run play matchup several times.
+
+        Yards after contact and fumble risk are fixed for a matchup, so only
+        the missed-tackle and fumble rolls are made per trial.
+        """
+        initial_gain = max(0, base_result.yards_gained // 2)
+        yac = self._calculate_run_after_contact(
+            runner, defenders, base_result.yards_gained - initial_gain
+        )
+        total_yards = initial_gain + yac
+        fumble_risk = self._calculate_fumble_risk(runner, defenders, total_yards)
+
+        fumbles, misses = _run_trials(
+            self.rng.random,
+            trials,
+            self._run_miss_chances(runner, defenders, yac),
+            fumble_risk,
+        )
+
+        results = []
+        for fumbled, missed_tackles in zip(fumbles, misses):
+            if fumbled:
+                results.append(
+                    PlayExecutionResult(
+                        outcome="FUMBLE",
+                        yards_gained=0,
+                        completed=False,
+                        key_players=[runner.name] + [d.name for d in defenders[:1]],
+                        dice_roll=base_result.dice_roll,
+                        total_modifier=base_result.total_modifier,
+                        final_total=base_result.final_total,
+                    )
+                )
+                continue
+
+            results.append(
+                PlayExecutionResult(
+                    outcome=base_result.outcome.name,
+                    yards_gained=total_yards,
+                    completed=True,
+                    initial_gain=initial_gain,
+                    yards_after_contact=yac,
+                    missed_tackles=missed_tackles,
+                    key_players=[runner.name],
+                    dice_roll=base_result.dice_roll,
+                    total_modifier=base_result.total_modifier,
+                    final_total=base_result.final_total,
+                )
+            )
+
+        return results
+
     def _calculate_completion_chance(
         self,
         qb: PlayerProfile,
@@ -327,6 +555,17 @@ class EnhancedResolutionEngine:
     ) -> int:
         """Calculate yards after catch."""
 
+        yac_high, yac_modifier = self._yac_profile(receiver, defender, initial_gain)
+
+        # Roll for YAC
+        yac_roll = int(self.rng.random() * (yac_high + 1))
+        return max(0, yac_roll + yac_modifier)
+
+    def _yac_profile(
+        self, receiver: PlayerProfile, defender: PlayerProfile, initial_gain: int
+    ) -> Tuple[int, int]:
+        """Get the top of the YAC roll and the ratings modifier added to it."""
+
         # YAC potential based on route type
         if initial_gain <= 5:  # Short routes have high YAC potential
             base_yac = 3
@@ -344,22 +583,23 @@ class EnhancedResolutionEngine:
         def_tackle = defender.get_skill(SkillCategory.TACKLE)
         def_factor = -(def_tackle - 70) // 10  # Better tackle = less YAC
 
-        # Roll for YAC
-        yac_roll = self.rng.randint(0, base_yac + 2)
-        yac = max(0, yac_roll + wr_factor + def_factor)
-
-        return yac
+        return base_yac + 2, wr_factor + def_factor
 
     def _calculate_missed_tackles(
         self, ball_carrier: PlayerProfile, defender: PlayerProfile, yards_after: int
     ) -> int:
         """Calculate how many tackles were missed."""
 
-        if yards_after <= 1:
-            return 0
+        return _roll_missed_tackles(
+            self.rng.random,
+            yards_after,
+            self._missed_tackle_modifier(ball_carrier, defender),
+        )
 
-        # More YAC generally means more missed tackles
-        base_chance = min(yards_after * 10, 40)  # Up to 40% chance
+    def _missed_tackle_modifier(
+        self, ball_carrier: PlayerProfile, defender: PlayerProfile
+    ) -> int:
+        """Get the ratings adjustment to the missed tackle chance."""
 
         # Ball carrier elusiveness
         bc_agility = ball_carrier.get_skill(SkillCategory.AGILITY)
@@ -369,16 +609,7 @@ class EnhancedResolutionEngine:
         def_tackle = defender.get_skill(SkillCategory.TACKLE)
         def_factor = -(def_tackle - 70) // 10
 
-        missed_chance = base_chance + (bc_factor * 5) + (def_factor * 5)
-
-        # Roll for each potential missed tackle
-        missed_tackles = 0
-        for _ in range(min(3, yards_after // 2)):  # Max 3 missed tackles
-            if self.rng.randint(1, 100) <= missed_chance:
-                missed_tackles += 1
-                missed_chance -= 15  # Each miss makes next one less likely
-
-        return missed_tackles
+        return (bc_factor * 5) + (def_factor * 5)
 
     def _calculate_run_after_contact(
         self, runner: PlayerProfile, defenders: List[PlayerProfile], base_yac: int
@@ -411,11 +642,23 @@ class EnhancedResolutionEngine:
     ) -> int:
         """Calculate missed tackles on runs."""
 
+        missed_tackles = 0
+        for miss_chance in self._run_miss_chances(runner, defenders, yac):
+            if self._roll_d100() <= miss_chance:
+                missed_tackles += 1
+
+        return missed_tackles
+
+    def _run_miss_chances(
+        self, runner: PlayerProfile, defenders: List[PlayerProfile], yac: int
+    ) -> List[int]:
+        """Get the chance of each defender missing a tackle on a run."""
+
         if yac <= 0 or not defenders:
-            return 0
+            return []
 
         # Similar to pass YAC missed tackles
-        missed_tackles = 0
+        miss_chances = []
         for defender in defenders[:2]:  # Max 2 defenders for simplicity
             miss_chance = min(yac * 8, 30)  # Base chance
 
@@ -423,11 +666,9 @@ class EnhancedResolutionEngine:
             def_tackle = (defender.get_skill(SkillCategory.TACKLE) - 70) // 10
 
             miss_chance += (runner_elusiveness * 5) - (def_tackle * 5)
+            miss_chances.append(miss_chance)
 
-            if self.rng.randint(1, 100) <= miss_chance:
-                missed_tackles += 1
-
-        return missed_tackles
+        return miss_chances
 
     def _calculate_fumble_risk(
         self, runner: PlayerProfile, defenders: List[PlayerProfile], total_yards: int
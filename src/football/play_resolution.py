@@ -1,7 +1,7 @@
 import random
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any
 import sys
 import os
 
@@ -158,6 +158,21 @@ class PlayResult:
     details: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class _PreparedPlay:
+    """Dice-independent parts of a play matchup, shared across snaps."""
+
+    offensive_play: FootballPlay
+    defensive_play: FootballPlay
+    matchup: MatchupResult
+    play_analysis: PlayAnalysis
+    play_type: PlayType
+    modifiers: Dict[str, int]
+    dice_expr: str
+    advantage: int
+    disadvantage: int
+
+
 class PlayResolutionEngine:
     """Resolves football plays using dice and formation analysis."""
 
@@ -169,11 +184,16 @@ class PlayResolutionEngine:
         self.matchup_analyzer = FormationMatchupAnalyzer()
         self.play_analyzer = PlayAnalyzer()  # Add the new play analyzer
 
+        # Formation matchups keyed by (offense, defense) formation name; the
+        # analysis is deterministic, so each pairing is only worked out once
+        self._matchup_cache: Dict[Tuple[str, str], MatchupResult] = {}
+
     def resolve_play(
         self,
         offensive_play: FootballPlay,
         defensive_play: FootballPlay,
         situation: Optional[Dict[str, Any]] = None,
+        analysis: Optional[PlayAnalysis] = None,
     ) -> PlayResult:
         """
         Resolve a play matchup using dice and configuration.
@@ -182,33 +202,69 @@ class PlayResolutionEngine:
             offensive_play: The offensive play being run
             defensive_play: The defensive play being run
             situation: Game situation (down, distance, field position, etc.)
+            analysis: Precomputed play analysis; skips the play analyzer if given
 
         Returns:
             PlayResult with outcome, yardage, and details
         """
+        prepared = self._prepare_play(
+            offensive_play, defensive_play, situation, analysis
+        )
+        return self._roll_play(prepared)
+
+    def resolve_play_batch(
+        self,
+        offensive_play: FootballPlay,
+        defensive_play: FootballPlay,
+        situation: Optional[Dict[str, Any]] = None,
+        analysis: Optional[PlayAnalysis] = None,
+        runs: int = 1,
+    ) -> List[PlayResult]:
+        """
+        Resolve the same play matchup several times.
+
+        The matchup analysis, modifiers and dice advantage don't change
+        between snaps, so they are worked out once and only the dice and
+        yardage are rolled per snap. Draws come off the engine's RNG in the
+        same order as repeated resolve_play calls.
+
+        Args:
+            offensive_play: The offensive play being run
+            defensive_play: The defensive play being run
+            situation: Game situation (down, distance, field position, etc.)
+            analysis: Precomputed play analysis; skips the play analyzer if given
+            runs: Number of snaps to resolve
+
+        Returns:
+            One PlayResult per snap
+        """
+        prepared = self._prepare_play(
+            offensive_play, defensive_play, situation, analysis
+        )
+        return [self._roll_play(prepared) for _ in range(runs)]
+
+    def _prepare_play(
+        self,
+        offensive_play: FootballPlay,
+        defensive_play: FootballPlay,
+        situation: Optional[Dict[str, Any]],
+        analysis: Optional[PlayAnalysis],
+    ) -> _PreparedPlay:
+        """Work out everything about a matchup that doesn't need the dice."""
         situation = situation or {}
 
         # Analyze formation matchup
-        try:
-            matchup = self.matchup_analyzer.analyze_matchup(
-                offensive_play.base_formation, defensive_play.base_formation
-            )
-        except ValueError:
-            # If formations aren't in matchup analyzer, create neutral matchup
-            matchup = MatchupResult(
-                offense_formation=offensive_play.base_formation,
-                defense_formation=defensive_play.base_formation,
-                run_advantage=MatchupAdvantage.NEUTRAL,
-                pass_advantage=MatchupAdvantage.NEUTRAL,
-                overall_advantage=MatchupAdvantage.NEUTRAL,
-                key_factors=[],
-                recommended_plays=[],
-            )
+        matchup = self._formation_matchup(
+            offensive_play.base_formation, defensive_play.base_formation
+        )
 
         # NEW: Analyze specific play assignments and techniques
-        play_analysis = self.play_analyzer.analyze_play_matchup(
-            offensive_play, defensive_play
-        )
+        if analysis is not None:
+            play_analysis = analysis
+        else:
+            play_analysis = self.play_analyzer.analyze_play_matchup(
+                offensive_play, defensive_play
+            )
 
         # Determine play type
         play_type = PlayType.RUN if offensive_play.play_type == "run" else PlayType.PASS
@@ -218,35 +274,77 @@ class PlayResolutionEngine:
             offensive_play, defensive_play, matchup, situation, play_analysis
         )
 
-        # Get base dice expression
-        dice_expr = self.config.base_dice[play_type]
-
         # Calculate advantage/disadvantage for dice rolling (now includes play analysis)
         advantage, disadvantage = self._calculate_dice_advantage(
             modifiers, matchup, play_type, play_analysis
         )
 
+        return _PreparedPlay(
+            offensive_play=offensive_play,
+            defensive_play=defensive_play,
+            matchup=matchup,
+            play_analysis=play_analysis,
+            play_type=play_type,
+            modifiers=modifiers,
+            dice_expr=self.config.base_dice[play_type],
+            advantage=advantage,
+            disadvantage=disadvantage,
+        )
+
+    def _formation_matchup(
+        self, offense_formation: str, defense_formation: str
+    ) -> MatchupResult:
+        """Get the (cached) matchup between two formations."""
+        key = (offense_formation, defense_formation)
+        matchup = self._matchup_cache.get(key)
+        if matchup is not None:
+            return matchup
+
+        try:
+            matchup = self.matchup_analyzer.analyze_matchup(
+                offense_formation, defense_formation
+            )
+        except ValueError:
+            # If formations aren't in matchup analyzer, create neutral matchup
+            matchup = MatchupResult(
+                offense_formation=offense_formation,
+                defense_formation=defense_formation,
+                run_advantage=MatchupAdvantage.NEUTRAL,
+                pass_advantage=MatchupAdvantage.NEUTRAL,
+                overall_advantage=MatchupAdvantage.NEUTRAL,
+                key_factors=[],
+                recommended_plays=[],
+            )
+
+        self._matchup_cache[key] = matchup
+        return matchup
+
+    def _roll_play(self, prepared: _PreparedPlay) -> PlayResult:
+        """Roll the dice for one snap of a prepared matchup."""
+
         # Roll dice!
-        dice_roll = roll_core(dice_expr, self.rng, advantage, disadvantage)
+        dice_roll = roll_core(
+            prepared.dice_expr, self.rng, prepared.advantage, prepared.disadvantage
+        )
 
         # Apply modifiers
-        total_modifier = sum(modifiers.values())
+        total_modifier = sum(prepared.modifiers.values())
         final_total = dice_roll + total_modifier
 
         # Determine outcome
         outcome = self._determine_outcome(final_total)
 
         # Calculate yardage
-        yards_gained = self._calculate_yardage(outcome, play_type)
+        yards_gained = self._calculate_yardage(outcome, prepared.play_type)
 
         # Create description (now includes play analysis details)
         description = self._create_description(
-            offensive_play,
-            defensive_play,
+            prepared.offensive_play,
+            prepared.defensive_play,
             outcome,
             yards_gained,
-            matchup,
-            play_analysis,
+            prepared.matchup,
+            prepared.play_analysis,
         )
 
         return PlayResult(
@@ -257,12 +355,12 @@ class PlayResolutionEngine:
             final_total=final_total,
             description=description,
             details={
-                "modifiers": modifiers,
-                "advantage": advantage,
-                "disadvantage": disadvantage,
-                "matchup": matchup,
-                "play_analysis": play_analysis,  # Include detailed play analysis
-                "play_type": play_type.value,
+                "modifiers": dict(prepared.modifiers),
+                "advantage": prepared.advantage,
+                "disadvantage": prepared.disadvantage,
+                "matchup": prepared.matchup,
+                "play_analysis": prepared.play_analysis,  # Detailed play analysis
+                "play_type": prepared.play_type.value,
             },
         )
 
@@ -0,0 +1,124 @@
+"""
+Unit tests for the play resolution engine.
+
+Tests how PlayResolutionEngine turns an offensive and defensive play call
+into a dice-driven result, and how callers can feed it a precomputed
+tactical analysis instead of running the play analyzer.
+"""
+
+from unittest.mock import Mock
+
+from football.play_analyzer import PlayAnalysis, PlayMatchupFactor
+from football.play_resolution import PlayResolutionEngine
+from football.plays import FootballPlay
+
+
+def _make_play(name, play_type, formation):
+    return FootballPlay(
+        name=name,
+        label=name.replace("_", " ").title(),
+        play_type=play_type,
+        base_formation=formation,
+        personnel=[formation],
+        assignments=[],
+    )
+
+
+def test_resolve_play_uses_precomputed_analysis():
+    """
+    Test that a precomputed analysis bypasses the play analyzer.
+
+    Showcases and tuning scripts script the tactical analysis for each
+    snap. Passing it straight to resolve_play means the engine's own
+    analyzer is never consulted and the supplied analysis drives the
+    play-advantage modifier.
+    """
+    engine = PlayResolutionEngine(seed=7)
+    engine.play_analyzer = Mock()
+
+    offense = _make_play("trap_right", "run", "I-formation")
+    defense = _make_play("base_43", "defense", "4-3")
+    analysis = PlayAnalysis(
+        advantages=[PlayMatchupFactor("TRAP_CONCEPT", +2, "LG pulls")],
+        disadvantages=[],
+        net_impact=2,
+        key_matchups=["LG vs DT"],
+        scheme_analysis={"concept": "trap"},
+        confidence=0.8,
+    )
+
+    result = engine.resolve_play(offense, defense, analysis=analysis)
+
+    print(f"\n🏈 Precomputed analysis result: {result.yards_gained} yards")
+
+    engine.play_analyzer.analyze_play_matchup.assert_not_called()
+    assert result.details["play_analysis"] is analysis
+    assert result.details["modifiers"]["play_advantages"] == 2
+
+
+def test_resolve_play_runs_analyzer_without_analysis():
+    """
+    Test that the play analyzer is still used when no analysis is given.
+    """
+    engine = PlayResolutionEngine(seed=7)
+    offense = _make_play("trap_right", "run", "I-formation")
+    defense = _make_play("base_43", "defense", "4-3")
+
+    analysis = PlayAnalysis(
+        advantages=[],
+        disadvantages=[],
+        net_impact=0,
+        key_matchups=[],
+        scheme_analysis={},
+        confidence=0.5,
+    )
+    engine.play_analyzer = Mock()
+    engine.play_analyzer.analyze_play_matchup.return_value = analysis
+
+    result = engine.resolve_play(offense, defense)
+
+    engine.play_analyzer.analyze_play_matchup.assert_called_once_with(offense, defense)
+    assert result.details["play_analysis"] is analysis
+
+
+def test_resolve_play_batch_matches_single_snaps():
+    """
+    Test that resolve_play_batch matches repeated resolve_play calls.
+
+    The batch method prepares the matchup once and only rolls the dice per
+    snap, so a seeded engine must give the same results either way.
+    """
+    offense = _make_play("trap_right", "run", "I-formation")
+    defense = _make_play("base_43", "defense", "4-3")
+    situation = {"down": 3, "distance": 2, "field_position": 45}
+
+    single = PlayResolutionEngine(seed=11)
+    expected = [single.resolve_play(offense, defense, situation) for _ in range(20)]
+
+    batch = PlayResolutionEngine(seed=11)
+    results = batch.resolve_play_batch(offense, defense, situation, runs=20)
+
+    avg_yards = sum(result.yards_gained for result in results) / len(results)
+    print(f"\n🏈 Batched snaps: {avg_yards:.1f} avg yards over {len(results)}")
+
+    assert results == expected
+    assert results[0].details["modifiers"] is not results[1].details["modifiers"]
+
+
+def test_formation_matchup_is_cached():
+    """
+    Test that each formation pairing is only analyzed once per engine.
+    """
+    engine = PlayResolutionEngine(seed=3)
+    engine.matchup_analyzer = Mock(wraps=engine.matchup_analyzer)
+
+    offense = _make_play("trap_right", "run", "I-formation")
+    defense = _make_play("base_43", "defense", "4-3")
+
+    first = engine.resolve_play(offense, defense)
+    second = engine.resolve_play(offense, defense)
+
+    engine.matchup_analyzer.analyze_matchup.assert_called_once_with(
+        "I-formation", "4-3"
+    )
+    assert first.details["matchup"] is second.details["matchup"]
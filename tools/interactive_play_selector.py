@@ -4,8 +4,10 @@ Interactive Play Selector - Choose offensive and defensive plays
 and see simulation results
 """
 
+import os
 import sys
 import yaml
+from collections import Counter
 from pathlib import Path
 import random
 
@@ -19,12 +21,100 @@ from football.enhanced_resolution import (
 # Add the src directory to Python path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+# Use libyaml's C parser when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _stuffed_yards(yards):
+    return min(yards, random.randint(-3, 1))
+
+
+def _big_play_yards(yards):
+    return max(yards, random.randint(8, 25))
+
+
+def _turnover_yards(yards):
+    return random.randint(-5, 0)
+
+
+# How each outcome overrides the base yardage; unlisted outcomes keep it
+_YARD_ADJUSTMENTS = {
+    "stuffed": _stuffed_yards,
+    "failed": _stuffed_yards,
+    "sack": _stuffed_yards,
+    "big_gain": _big_play_yards,
+    "big_play": _big_play_yards,
+    "fumble": _turnover_yards,
+    "interception": _turnover_yards,
+    "turnover": _turnover_yards,
+}
+
+
+def _make_snap_sampler(low, high, outcomes, cum_weights):
+    """Build a sampler specialized to one matchup's yards and outcome table"""
+    choices = random.choices
+    randint = random.randint
+    # Pair each outcome with its yard adjustment up front so the sampling
+    # loop does no string comparisons
+    table = [(outcome, _YARD_ADJUSTMENTS.get(outcome)) for outcome in outcomes]
+
+    def sample(n):
+        results = []
+        for outcome, adjust in choices(table, cum_weights=cum_weights, k=n):
+            yards = randint(low, high)
+            if adjust is not None:
+                yards = adjust(yards)
+            results.append({"yards": yards, "outcome": outcome})
+        return results
+
+    return sample
+
 
 class InteractivePlaySelector:
+    # Keywords used to classify a play as run or pass
+    _RUN_KEYWORDS = frozenset(
+        {"run", "zone", "power", "draw", "sweep", "dive", "trap", "counter"}
+    )
+    _PASS_KEYWORDS = frozenset(
+        {"pass", "slant", "route", "throw", "reception", "vert", "screen"}
+    )
+
+    # Outcome tables with cumulative weights, so random.choices doesn't
+    # rebuild them on every draw
+    _RUN_OUTCOMES = ("successful_run", "stuffed", "big_gain", "fumble")
+    _RUN_CUM_WEIGHTS = (60, 85, 98, 100)
+    _PASS_OUTCOMES = ("complete", "incomplete", "interception", "sack")
+    _PASS_CUM_WEIGHTS = (45, 85, 93, 100)
+    _PASS_RUSH_CUM_WEIGHTS = (50, 85, 90, 100)  # Quick timing vs pass rush
+    _SPECIAL_OUTCOMES = ("successful", "failed", "turnover", "big_play")
+    _SPECIAL_CUM_WEIGHTS = (50, 85, 95, 100)
+
+    # Skill ratings shared by every average player; PlayerProfile only
+    # reads its skills, so one dict can back all of them
+    _AVERAGE_SKILLS = {
+        SkillCategory.AWARENESS: 75,
+        SkillCategory.HANDS: 75,
+        SkillCategory.STRENGTH: 75,
+        SkillCategory.AGILITY: 75,
+        SkillCategory.SPEED: 75,
+        SkillCategory.PASS_BLOCKING: 75,
+        SkillCategory.RUN_BLOCKING: 75,
+        SkillCategory.PASS_RUSH: 75,
+        SkillCategory.RUN_DEFENSE: 75,
+        SkillCategory.COVERAGE: 75,
+        SkillCategory.TACKLE: 75,
+        SkillCategory.ROUTE_RUNNING: 75,
+    }
+
     def __init__(self):
         self.repo_root = Path(__file__).parent.parent
         self.engine = EnhancedResolutionEngine()
 
+        # Plays don't change during a session, so cache what we derive
+        # from them: the listing per play type and the type per play name
+        self._plays_cache = {}
+        self._play_type_cache = {}
+
         # Create average players for simulation
         self.average_players = self._create_average_players()
 
@@ -77,20 +167,7 @@ class InteractivePlaySelector:
                 name=f"Average {position}",
                 position=position,
                 overall_rating=75,
-                skills={
-                    SkillCategory.AWARENESS: 75,
-                    SkillCategory.HANDS: 75,
-                    SkillCategory.STRENGTH: 75,
-                    SkillCategory.AGILITY: 75,
-                    SkillCategory.SPEED: 75,
-                    SkillCategory.PASS_BLOCKING: 75,
-                    SkillCategory.RUN_BLOCKING: 75,
-                    SkillCategory.PASS_RUSH: 75,
-                    SkillCategory.RUN_DEFENSE: 75,
-                    SkillCategory.COVERAGE: 75,
-                    SkillCategory.TACKLE: 75,
-                    SkillCategory.ROUTE_RUNNING: 75,
-                },
+                skills=self._AVERAGE_SKILLS,
                 traits=["average"],
             )
 
@@ -98,9 +175,18 @@ class InteractivePlaySelector:
 
     def list_plays(self, play_type):
         """List available plays of given type (offense/defense)"""
+        if play_type in self._plays_cache:
+            return self._plays_cache[play_type]
+
         plays_dir = self.repo_root / "data" / "plays" / play_type
-        play_files = [f.stem for f in plays_dir.glob("*.yaml")]
-        return sorted(play_files)
+        with os.scandir(plays_dir) as entries:
+            play_files = [
+                entry.name[:-5]
+                for entry in entries
+                if entry.name.endswith(".yaml") and entry.is_file()
+            ]
+        self._plays_cache[play_type] = sorted(play_files)
+        return self._plays_cache[play_type]
 
     def display_play_options(self, play_type):
         """Display numbered list of plays for selection"""
@@ -137,8 +223,7 @@ class InteractivePlaySelector:
             play_file = (
                 self.repo_root / "data" / "plays" / play_type / f"{play_name}.yaml"
             )
-            with open(play_file, "r") as f:
-                return yaml.safe_load(f)
+            return yaml.load(play_file.read_bytes(), Loader=_YAML_LOADER)
         except Exception as e:
             print(f"Error loading play {play_name}: {e}")
             return None
@@ -184,17 +269,14 @@ class InteractivePlaySelector:
             self.show_play_details(offensive_play, "offense")
             self.show_play_details(defensive_play, "defense")
 
-            print(f"\n{'SIMULATION RESULTS':^60}")
-            print("-" * 60)
+            out = [f"\n{'SIMULATION RESULTS':^60}", "-" * 60]
 
             # Simple simulation logic based on play characteristics
-            results = []
-            for i in range(10):
-                result = self._simulate_single_play(offense_data, defense_data)
-                results.append(result)
+            results = self._simulate_batch(offense_data, defense_data, 10)
+            for i, result in enumerate(results):
                 outcome = result["outcome"]
                 yards = result["yards"]
-                print(f"Sim {i + 1:2d}: {yards:+3d} yards - {outcome}")
+                out.append(f"Sim {i + 1:2d}: {yards:+3d} yards - {outcome}")
 
             # Show summary statistics
             total_yards = sum(r["yards"] for r in results)
@@ -203,20 +285,21 @@ class InteractivePlaySelector:
             min_yards = min(r["yards"] for r in results)
 
             # Count outcomes
-            outcomes = {}
-            for result in results:
-                outcomes[result["outcome"]] = outcomes.get(result["outcome"], 0) + 1
+            outcomes = Counter(result["outcome"] for result in results)
 
-            print("-" * 60)
-            print(f"SUMMARY ({len(results)} simulations):")
-            print(f"  Average: {avg_yards:+5.1f} yards")
-            print(f"  Range: {min_yards:+3d} to {max_yards:+3d} yards")
-            print(f"  Total: {total_yards:+4d} yards")
+            out.append("-" * 60)
+            out.append(f"SUMMARY ({len(results)} simulations):")
+            out.append(f"  Average: {avg_yards:+5.1f} yards")
+            out.append(f"  Range: {min_yards:+3d} to {max_yards:+3d} yards")
+            out.append(f"  Total: {total_yards:+4d} yards")
 
-            print("\nOUTCOME BREAKDOWN:")
+            out.append("\nOUTCOME BREAKDOWN:")
             for outcome, count in sorted(outcomes.items()):
                 percentage = (count / len(results)) * 100
-                print(f"  {outcome}: {count}/{len(results)} ({percentage:.0f}%)")
+                out.append(f"  {outcome}: {count}/{len(results)} ({percentage:.0f}%)")
+
+            # Emit the whole results block in one write
+            sys.stdout.write("\n".join(out) + "\n")
 
             return results
 
@@ -226,120 +309,86 @@ class InteractivePlaySelector:
 
     def _simulate_single_play(self, offense_data, defense_data):
         """Simple simulation logic for a single play"""
+        return self._simulate_batch(offense_data, defense_data, 1)[0]
+
+    def _simulate_batch(self, offense_data, defense_data, n=10):
+        """Simulate n snaps of the same matchup with one batched outcome draw"""
         play_type = self._determine_play_type(offense_data)
-        off_advantages = offense_data.get("tactical_advantages", [])
-        def_advantages = defense_data.get("tactical_advantages", [])
+        off_advantages = frozenset(offense_data.get("tactical_advantages", ()))
+        def_advantages = frozenset(defense_data.get("tactical_advantages", ()))
 
+        # The yard range and outcome weights only depend on the matchup,
+        # so they are computed once rather than per snap
         if play_type == "run":
-            return self._simulate_run_play(off_advantages, def_advantages)
+            low, high, outcomes, cum_weights = self._run_play_profile(
+                off_advantages, def_advantages
+            )
         elif play_type == "pass":
-            return self._simulate_pass_play(off_advantages, def_advantages)
+            low, high, outcomes, cum_weights = self._pass_play_profile(
+                off_advantages, def_advantages
+            )
         else:
-            return self._simulate_special_play(off_advantages, def_advantages)
+            low, high, outcomes, cum_weights = self._special_play_profile()
 
-    def _simulate_run_play(self, off_advantages, def_advantages):
-        base_yards = random.randint(-2, 8)
-        outcomes = ["successful_run", "stuffed", "big_gain", "fumble"]
-        weights = [60, 25, 13, 2]
+        sample = _make_snap_sampler(low, high, outcomes, cum_weights)
+        return sample(n)
+
+    def _run_play_profile(self, off_advantages, def_advantages):
+        low, high = -2, 8
 
         if "goal_line_power" in off_advantages and "goal_line_stop" in def_advantages:
-            base_yards -= 1
+            low, high = low - 1, high - 1
         elif (
             "outside_speed" in off_advantages
             and "edge_discipline" not in def_advantages
         ):
-            base_yards += 2
+            low, high = low + 2, high + 2
         elif "gap_control" in def_advantages and "power_running" in off_advantages:
-            base_yards -= 1
-
-        outcome = random.choices(outcomes, weights=weights)[0]
+            low, high = low - 1, high - 1
 
-        if outcome == "stuffed":
-            base_yards = min(base_yards, random.randint(-3, 1))
-        elif outcome == "big_gain":
-            base_yards = max(base_yards, random.randint(8, 25))
-        elif outcome == "fumble":
-            base_yards = random.randint(-5, 0)
+        return low, high, self._RUN_OUTCOMES, self._RUN_CUM_WEIGHTS
 
-        return {"yards": base_yards, "outcome": outcome}
-
-    def _simulate_pass_play(self, off_advantages, def_advantages):
-        base_yards = random.randint(-1, 12)
-        outcomes = ["complete", "incomplete", "interception", "sack"]
-        weights = [45, 40, 8, 7]
+    def _pass_play_profile(self, off_advantages, def_advantages):
+        low, high = -1, 12
+        cum_weights = self._PASS_CUM_WEIGHTS
 
         if "deep_threat" in off_advantages and "deep_coverage" in def_advantages:
-            base_yards += 1
+            low, high = low + 1, high + 1
         elif "quick_timing" in off_advantages and "pass_rush" in def_advantages:
-            weights = [50, 35, 5, 10]
+            cum_weights = self._PASS_RUSH_CUM_WEIGHTS
         elif "mismatch_creation" in off_advantages:
-            base_yards += 3
-
-        outcome = random.choices(outcomes, weights=weights)[0]
-
-        if outcome == "sack":
-            base_yards = min(base_yards, random.randint(-3, 1))
-        elif outcome == "big_gain":
-            base_yards = max(base_yards, random.randint(8, 25))
-        elif outcome in ["interception"]:
-            base_yards = random.randint(-5, 0)
-
-        return {"yards": base_yards, "outcome": outcome}
+            low, high = low + 3, high + 3
 
-    def _simulate_special_play(self, off_advantages, def_advantages):
-        base_yards = random.randint(-3, 15)
-        outcomes = ["successful", "failed", "turnover", "big_play"]
-        weights = [50, 35, 10, 5]
+        return low, high, self._PASS_OUTCOMES, cum_weights
 
-        outcome = random.choices(outcomes, weights=weights)[0]
-
-        if outcome == "failed":
-            base_yards = min(base_yards, random.randint(-3, 1))
-        elif outcome == "big_play":
-            base_yards = max(base_yards, random.randint(8, 25))
-        elif outcome in ["turnover"]:
-            base_yards = random.randint(-5, 0)
-
-        return {"yards": base_yards, "outcome": outcome}
+    def _special_play_profile(self):
+        return -3, 15, self._SPECIAL_OUTCOMES, self._SPECIAL_CUM_WEIGHTS
 
     def _determine_play_type(self, offense_data):
         """Determine if play is run, pass, or special based on play data"""
         name = offense_data.get("name", "").lower()
+        if name in self._play_type_cache:
+            return self._play_type_cache[name]
+
         description = offense_data.get("description", "").lower()
         execution = offense_data.get("execution_notes", "").lower()
-
-        # Check for run indicators
-        run_keywords = [
-            "run",
-            "zone",
-            "power",
-            "draw",
-            "sweep",
-            "dive",
-            "trap",
-            "counter",
-        ]
-        pass_keywords = [
-            "pass",
-            "slant",
-            "route",
-            "throw",
-            "reception",
-            "vert",
-            "screen",
-        ]
-
         text_to_check = f"{name} {description} {execution}"
 
-        run_count = sum(1 for keyword in run_keywords if keyword in text_to_check)
-        pass_count = sum(1 for keyword in pass_keywords if keyword in text_to_check)
+        # Substring matching so e.g. "vert" still matches "verticals"
+        run_count = sum(1 for keyword in self._RUN_KEYWORDS if keyword in text_to_check)
+        pass_count = sum(
+            1 for keyword in self._PASS_KEYWORDS if keyword in text_to_check
+        )
 
         if run_count > pass_count:
-            return "run"
+            play_type = "run"
         elif pass_count > run_count:
-            return "pass"
+            play_type = "pass"
         else:
-            return "special"
+            play_type = "special"
+
+        self._play_type_cache[name] = play_type
+        return play_type
 
     def run_interactive_session(self):
         """Main interactive loop"""
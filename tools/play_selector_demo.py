@@ -3,8 +3,12 @@
 Demo of Interactive Play Selector - Shows example simulation without user input
 """
 
+import io
+import os
 import sys
 import yaml
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 
 # from typing import Dict, List, Any, Optional
@@ -18,26 +22,112 @@ from football.enhanced_resolution import (
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+# Use libyaml's C parser when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Keywords used to classify a play as run or pass
+_RUN_KEYWORDS = frozenset(
+    {"run", "zone", "power", "draw", "sweep", "dive", "trap", "counter"}
+)
+_PASS_KEYWORDS = frozenset(
+    {"pass", "slant", "route", "throw", "reception", "vert", "screen"}
+)
+
+
+@lru_cache(maxsize=None)
+def _classify_play_text(text_to_check):
+    """Classify a play's combined name/description/notes text"""
+    # Substring matching so e.g. "vert" still matches "verts"
+    run_count = sum(1 for keyword in _RUN_KEYWORDS if keyword in text_to_check)
+    pass_count = sum(1 for keyword in _PASS_KEYWORDS if keyword in text_to_check)
+
+    if run_count > pass_count:
+        return "run"
+    elif pass_count > run_count:
+        return "pass"
+    else:
+        return "special"
+
+
+# Outcome tables with cumulative weights, so random.choices doesn't
+# rebuild them on every call
+_RUN_OUTCOMES = ("successful_run", "stuffed", "big_gain", "fumble")
+_CUM_RUN = (60, 85, 98, 100)
+_PASS_OUTCOMES = ("complete", "incomplete", "interception", "sack")
+_CUM_PASS = (45, 85, 93, 100)
+_CUM_PASS_TIMING = (50, 85, 90, 100)
+_SPECIAL_OUTCOMES = ("successful", "failed", "turnover", "big_play")
+_CUM_SPECIAL = (50, 85, 95, 100)
+
+
+def _sample_batch(low, high, outcomes, cum_weights, n):
+    """Sample n plays from a yard range and outcome distribution
+
+    Returns parallel (yards, outcomes) lists rather than one dict per play.
+    """
+    randint = random.randint
+    chosen = random.choices(outcomes, cum_weights=cum_weights, k=n)
+    yards = []
+    for outcome in chosen:
+        base_yards = randint(low, high)
+
+        # Adjust yards based on outcome
+        if outcome in ("stuffed", "failed", "sack"):
+            base_yards = min(base_yards, randint(-3, 1))
+        elif outcome in ("big_gain", "big_play"):
+            base_yards = max(base_yards, randint(8, 25))
+        elif outcome in ("fumble", "interception", "turnover"):
+            base_yards = randint(-5, 0)
+
+        yards.append(base_yards)
+
+    return yards, chosen
+
 
 class PlaySelectorDemo:
     def __init__(self):
         self.repo_root = Path(__file__).parent.parent
         self.engine = EnhancedResolutionEngine()
 
+        # Parsed play data keyed by (play_name, play_type); callers only
+        # read it, so the same dict is handed out on every call
+        self._play_cache = {}
+
+        # Sorted play names per play type
+        self._plays_cache = {}
+
     def list_plays(self, play_type):
         """List available plays of given type (offense/defense)"""
+        if play_type in self._plays_cache:
+            return self._plays_cache[play_type]
+
         plays_dir = self.repo_root / "data" / "plays" / play_type
-        play_files = [f.stem for f in plays_dir.glob("*.yaml")]
-        return sorted(play_files)
+        with os.scandir(plays_dir) as entries:
+            play_files = sorted(
+                entry.name[:-5]
+                for entry in entries
+                if entry.is_file() and entry.name.endswith(".yaml")
+            )
+        self._plays_cache[play_type] = play_files
+        return play_files
 
     def load_play_data(self, play_name, play_type):
-        """Load play data from YAML file"""
+        """Load play data from YAML file, parsing each file once"""
+        key = (play_name, play_type)
+        if key in self._play_cache:
+            return self._play_cache[key]
+
         try:
             play_file = (
                 self.repo_root / "data" / "plays" / play_type / f"{play_name}.yaml"
             )
-            with open(play_file, "r") as f:
-                return yaml.safe_load(f)
+            with open(play_file, "rb") as f:
+                play_data = yaml.load(f, Loader=_YAML_LOADER)
+            # Intern the play name so lookups keyed on it compare by identity
+            if play_data and isinstance(play_data.get("name"), str):
+                play_data["name"] = sys.intern(play_data["name"])
+            self._play_cache[key] = play_data
+            return play_data
         except Exception as e:
             print(f"Error loading play {play_name}: {e}")
             return None
@@ -65,69 +155,59 @@ class PlaySelectorDemo:
 
     def _simulate_single_play(self, offense_data, defense_data):
         """Simple simulation logic for a single play"""
+        yards, outcomes = self._simulate_batch(offense_data, defense_data, 1)
+        return {"yards": yards[0], "outcome": outcomes[0]}
+
+    def _simulate_batch(self, offense_data, defense_data, n):
+        """Simulate n plays of one matchup, drawing all outcomes in one call"""
         play_type = self._determine_play_type(offense_data)
         off_advantages = offense_data.get("tactical_advantages", [])
         def_advantages = defense_data.get("tactical_advantages", [])
 
+        # Yard range and outcome weights are fixed for the matchup
         if play_type == "run":
-            base_yards, outcomes, weights = self._run_play_adjustments(
+            (low, high), outcomes, cum_weights = self._run_play_adjustments(
                 off_advantages, def_advantages
             )
         elif play_type == "pass":
-            base_yards, outcomes, weights = self._pass_play_adjustments(
+            (low, high), outcomes, cum_weights = self._pass_play_adjustments(
                 off_advantages, def_advantages
             )
         else:
-            base_yards, outcomes, weights = self._special_play_adjustments()
+            (low, high), outcomes, cum_weights = self._special_play_adjustments()
 
-        outcome = random.choices(outcomes, weights=weights)[0]
-
-        # Adjust yards based on outcome
-        if outcome in ["stuffed", "failed", "sack"]:
-            base_yards = min(base_yards, random.randint(-3, 1))
-        elif outcome in ["big_gain", "big_play"]:
-            base_yards = max(base_yards, random.randint(8, 25))
-        elif outcome in ["fumble", "interception", "turnover"]:
-            base_yards = random.randint(-5, 0)
-
-        return {"yards": base_yards, "outcome": outcome}
+        return _sample_batch(low, high, outcomes, cum_weights, n)
 
     def _run_play_adjustments(self, off_advantages, def_advantages):
-        base_yards = random.randint(-2, 8)
-        outcomes = ["successful_run", "stuffed", "big_gain", "fumble"]
-        weights = [60, 25, 13, 2]
+        shift = 0
 
         if "goal_line_power" in off_advantages and "goal_line_stop" in def_advantages:
-            base_yards -= 1  # Even matchup
+            shift = -1  # Even matchup
         elif (
             "outside_speed" in off_advantages
             and "edge_discipline" not in def_advantages
         ):
-            base_yards += 2  # Advantage to offense
+            shift = 2  # Advantage to offense
         elif "gap_control" in def_advantages and "power_running" in off_advantages:
-            base_yards -= 1  # Advantage to defense
+            shift = -1  # Advantage to defense
 
-        return base_yards, outcomes, weights
+        return (-2 + shift, 8 + shift), _RUN_OUTCOMES, _CUM_RUN
 
     def _pass_play_adjustments(self, off_advantages, def_advantages):
-        base_yards = random.randint(-1, 12)
-        outcomes = ["complete", "incomplete", "interception", "sack"]
-        weights = [45, 40, 8, 7]
+        shift = 0
+        cum_weights = _CUM_PASS
 
         if "deep_threat" in off_advantages and "deep_coverage" in def_advantages:
-            base_yards += 1  # Even but slight edge to offense
+            shift = 1  # Even but slight edge to offense
         elif "quick_timing" in off_advantages and "pass_rush" in def_advantages:
-            weights = [50, 35, 5, 10]  # More sacks
+            cum_weights = _CUM_PASS_TIMING  # More sacks
         elif "mismatch_creation" in off_advantages:
-            base_yards += 3  # Good advantage
+            shift = 3  # Good advantage
 
-        return base_yards, outcomes, weights
+        return (-1 + shift, 12 + shift), _PASS_OUTCOMES, cum_weights
 
     def _special_play_adjustments(self):
-        base_yards = random.randint(-3, 15)
-        outcomes = ["successful", "failed", "turnover", "big_play"]
-        weights = [50, 35, 10, 5]
-        return base_yards, outcomes, weights
+        return (-3, 15), _SPECIAL_OUTCOMES, _CUM_SPECIAL
 
     def _determine_play_type(self, offense_data):
         """Determine if play is run, pass, or special based on play data"""
@@ -135,40 +215,9 @@ class PlaySelectorDemo:
         description = offense_data.get("description", "").lower()
         execution = offense_data.get("execution_notes", "").lower()
 
-        # Check for run indicators
-        run_keywords = [
-            "run",
-            "zone",
-            "power",
-            "draw",
-            "sweep",
-            "dive",
-            "trap",
-            "counter",
-        ]
-        pass_keywords = [
-            "pass",
-            "slant",
-            "route",
-            "throw",
-            "reception",
-            "vert",
-            "screen",
-        ]
-
-        text_to_check = f"{name} {description} {execution}"
-
-        run_count = sum(1 for keyword in run_keywords if keyword in text_to_check)
-        pass_count = sum(1 for keyword in pass_keywords if keyword in text_to_check)
-
-        if run_count > pass_count:
-            return "run"
-        elif pass_count > run_count:
-            return "pass"
-        else:
-            return "special"
+        return _classify_play_text(f"{name} {description} {execution}")
 
-    def run_demo_simulation(self, offensive_play, defensive_play):
+    def run_demo_simulation(self, offensive_play, defensive_play, show_details=True):
         """Run a demo simulation with the specified plays"""
         offense_data = self.load_play_data(offensive_play, "offense")
         defense_data = self.load_play_data(defensive_play, "defense")
@@ -186,44 +235,47 @@ class PlaySelectorDemo:
         print(f"{'=' * 60}")
 
         # Show play details
-        self.show_play_details(offensive_play, "offense")
-        self.show_play_details(defensive_play, "defense")
+        if show_details:
+            self.show_play_details(offensive_play, "offense")
+            self.show_play_details(defensive_play, "defense")
 
-        print(f"\n{'SIMULATION RESULTS':^60}")
-        print("-" * 60)
+        # Buffer the results block and write it to stdout in one go
+        buf = io.StringIO()
+        buf.write(f"\n{'SIMULATION RESULTS':^60}\n")
+        buf.write("-" * 60 + "\n")
 
         # Run multiple simulations to show variance
-        results = []
-        for i in range(10):
-            result = self._simulate_single_play(offense_data, defense_data)
-            results.append(result)
-            outcome = result["outcome"]
-            yards = result["yards"]
-            print(f"Sim {i + 1:2d}: {yards:+3d} yards - {outcome}")
+        yards_list, outcome_list = self._simulate_batch(offense_data, defense_data, 10)
+        for i, (yards, outcome) in enumerate(zip(yards_list, outcome_list)):
+            buf.write(f"Sim {i + 1:2d}: {yards:+3d} yards - {outcome}\n")
 
         # Show summary statistics
-        total_yards = sum(r["yards"] for r in results)
-        avg_yards = total_yards / len(results)
-        max_yards = max(r["yards"] for r in results)
-        min_yards = min(r["yards"] for r in results)
+        total_yards = sum(yards_list)
+        avg_yards = total_yards / len(yards_list)
+        max_yards = max(yards_list)
+        min_yards = min(yards_list)
 
         # Count outcomes
-        outcomes = {}
-        for result in results:
-            outcomes[result["outcome"]] = outcomes.get(result["outcome"], 0) + 1
+        outcomes = Counter(outcome_list)
 
-        print("-" * 60)
-        print(f"SUMMARY ({len(results)} simulations):")
-        print(f"  Average: {avg_yards:+5.1f} yards")
-        print(f"  Range: {min_yards:+3d} to {max_yards:+3d} yards")
-        print(f"  Total: {total_yards:+4d} yards")
+        buf.write("-" * 60 + "\n")
+        buf.write(f"SUMMARY ({len(yards_list)} simulations):\n")
+        buf.write(f"  Average: {avg_yards:+5.1f} yards\n")
+        buf.write(f"  Range: {min_yards:+3d} to {max_yards:+3d} yards\n")
+        buf.write(f"  Total: {total_yards:+4d} yards\n")
 
-        print("\nOUTCOME BREAKDOWN:")
+        buf.write("\nOUTCOME BREAKDOWN:\n")
         for outcome, count in sorted(outcomes.items()):
-            percentage = (count / len(results)) * 100
-            print(f"  {outcome}: {count}/{len(results)} ({percentage:.0f}%)")
+            percentage = (count / len(yards_list)) * 100
+            buf.write(f"  {outcome}: {count}/{len(yards_list)} ({percentage:.0f}%)\n")
+
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
 
-        return results
+        return [
+            {"yards": yards, "outcome": outcome}
+            for yards, outcome in zip(yards_list, outcome_list)
+        ]
 
 
 if __name__ == "__main__":
@@ -247,7 +299,12 @@ if __name__ == "__main__":
         ("four_verts", "dime_cover4_quarters"),  # Deep passing vs deep coverage
     ]
 
+    # Only print play details the first time a matchup comes up
+    seen = set()
     for off_play, def_play in examples:
-        demo.run_demo_simulation(off_play, def_play)
+        demo.run_demo_simulation(
+            off_play, def_play, show_details=(off_play, def_play) not in seen
+        )
+        seen.add((off_play, def_play))
         print("\n" + "=" * 60)
         input("Press Enter to continue to next simulation...")